@@ -6,17 +6,15 @@ Automatically provides daily briefings with weather, news, stocks, and calendar
 
 import asyncio
 import logging
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from typing import Dict, Any
-import schedule
-import time as time_module
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 from src.briefing_service import BriefingService
-from src.config import Config
+from src.config import get_config
 from src.notifier import Notifier
 
 # Configure logging
@@ -31,14 +29,21 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Daily briefing times (local time)
+BRIEFING_TIMES = [
+    time(8, 0),
+    # You can add more briefing times here
+    # time(18, 0),
+]
+
 
 class DailyBriefingBot:
     """Main class for the Daily Briefing Bot"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.briefing_service = BriefingService(self.config)
-        self.notifier = Notifier(self.config)
+        self.notifier = Notifier(self.config, self.briefing_service.http_session)
         
     async def generate_daily_briefing(self) -> Dict[str, Any]:
         """Generate the complete daily briefing"""
@@ -61,29 +66,35 @@ class DailyBriefingBot:
         else:
             logger.error(f"Failed to send briefing: {briefing_data['error']}")
     
-    def schedule_briefings(self):
-        """Schedule the daily briefing jobs"""
-        # Schedule for 8:00 AM daily
-        schedule.every().day.at("08:00").do(
-            lambda: asyncio.run(self.send_briefing())
-        )
-        
-        # You can add more scheduled times here
-        # schedule.every().day.at("18:00").do(lambda: asyncio.run(self.send_briefing()))
-        
-        logger.info("Briefing scheduled for 8:00 AM daily")
+    def _next_briefing_time(self) -> datetime:
+        """Get the next time a briefing is due"""
+        now = datetime.now()
+        upcoming = []
+        for briefing_time in BRIEFING_TIMES:
+            run_at = datetime.combine(now.date(), briefing_time)
+            if run_at <= now:
+                run_at += timedelta(days=1)
+            upcoming.append(run_at)
+        return min(upcoming)
     
-    def run(self):
-        """Start the bot and keep it running"""
+    async def run_async(self):
+        """Start the bot and keep it running on a single event loop"""
         logger.info("Starting Daily Briefing Bot...")
+        times = ", ".join(t.strftime("%I:%M %p") for t in BRIEFING_TIMES)
+        logger.info(f"Briefings scheduled daily at {times}")
         
-        # Schedule the briefings
-        self.schedule_briefings()
-        
-        # Keep the bot running
-        while True:
-            schedule.run_pending()
-            time_module.sleep(60)  # Check every minute
+        # Services (and their shared HTTP session) live for the whole run,
+        # so consecutive briefings reuse the same connection pool
+        async with self.briefing_service:
+            while True:
+                next_run = self._next_briefing_time()
+                logger.info(f"Next briefing at {next_run:%Y-%m-%d %H:%M}")
+                
+                # Cap each sleep so clock adjustments can't make us miss a run
+                while (remaining := (next_run - datetime.now()).total_seconds()) > 0:
+                    await asyncio.sleep(min(remaining, 3600))
+                
+                await self.send_briefing()
 
 
 def main():
@@ -91,7 +102,7 @@ def main():
     bot = DailyBriefingBot()
     
     try:
-        bot.run()
+        asyncio.run(bot.run_async())
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
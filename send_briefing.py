@@ -8,7 +8,7 @@ import logging
 import os
 from dotenv import load_dotenv
 from src.briefing_service import BriefingService
-from src.config import Config
+from src.config import get_config
 from src.notifier import Notifier
 
 # Load environment variables
@@ -26,7 +26,7 @@ async def send_daily_briefing():
     """Send daily briefing via GitHub Actions"""
     try:
         # Initialize services
-        config = Config()
+        config = get_config()
         
         # Debug: Check if environment variables are loaded
         logger.info(f"NEWS_API_KEY configured: {bool(config.news_api_key)}")
@@ -35,16 +35,16 @@ async def send_daily_briefing():
         logger.info(f"EMAIL_TO configured: {bool(config.email_to)}")
         logger.info(f"Email enabled: {config.email_enabled}")
         
-        briefing_service = BriefingService(config)
-        notifier = Notifier(config)
-        
-        # Generate briefing
-        logger.info("Generating daily briefing...")
-        briefing_data = await briefing_service.get_full_briefing()
-        
-        # Send briefing
-        logger.info("Sending daily briefing...")
-        await notifier.send_briefing(briefing_data)
+        async with BriefingService(config) as briefing_service:
+            notifier = Notifier(config, briefing_service.http_session)
+            
+            # Generate briefing
+            logger.info("Generating daily briefing...")
+            briefing_data = await briefing_service.get_full_briefing()
+            
+            # Send briefing
+            logger.info("Sending daily briefing...")
+            await notifier.send_briefing(briefing_data)
         
         # Check if news data exists
         news = briefing_data.get("news")
@@ -3,33 +3,54 @@ Briefing Service - Coordinates all data collection for the daily briefing
 """
 
 import asyncio
+import functools
 import logging
 from typing import Dict, Any
-from datetime import datetime
+from datetime import date, datetime
 
 from .weather_service import WeatherService
 from .news_service import NewsService
 from .stock_service import StockService
 from .calendar_service import CalendarService
+from .http_client import SharedSession
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _format_briefing_date(day: date) -> str:
+    """Format the briefing date (memoized, so repeat runs on a day are free)"""
+    return day.strftime("%A, %B %d, %Y")
+
+
 class BriefingService:
     """Service to coordinate all briefing data collection"""
     
     def __init__(self, config):
         self.config = config
-        self.weather_service = WeatherService(config)
-        self.news_service = NewsService(config)
-        self.stock_service = StockService(config)
+        # One HTTP session (and connection pool) shared by every service
+        self.http_session = SharedSession()
+        self.weather_service = WeatherService(config, self.http_session)
+        self.news_service = NewsService(config, self.http_session)
+        self.stock_service = StockService(config, self.http_session)
         self.calendar_service = CalendarService(config)
     
+    async def close(self):
+        """Close the shared HTTP session"""
+        await self.http_session.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
     async def get_full_briefing(self) -> Dict[str, Any]:
         """Get all briefing data asynchronously"""
+        now = datetime.now()
         briefing_data = {
-            "timestamp": datetime.now().isoformat(),
-            "date": datetime.now().strftime("%A, %B %d, %Y"),
+            "timestamp": now.isoformat(),
+            "date": _format_briefing_date(now.date()),
             "weather": None,
             "news": None,
             "stocks": None,
@@ -37,49 +58,35 @@ class BriefingService:
             "errors": []
         }
         
-        # Collect all data concurrently
-        tasks = []
+        # Collect all data concurrently, keyed by briefing section
+        tasks = {}
         
         # Weather (Open-Meteo is free, always available)
-        tasks.append(self._get_weather_safe())
+        tasks["weather"] = self._get_weather_safe()
         
         # News
         if self.config.news_api_key:
-            tasks.append(self._get_news_safe())
+            tasks["news"] = self._get_news_safe()
         else:
             briefing_data["errors"].append("News: API key not configured")
         
         # Stocks
         if self.config.stock_api_key:
-            tasks.append(self._get_stocks_safe())
+            tasks["stocks"] = self._get_stocks_safe()
         else:
             briefing_data["errors"].append("Stocks: API key not configured")
         
         # Calendar
         if self.config.calendar_enabled:
-            tasks.append(self._get_calendar_safe())
+            tasks["calendar"] = self._get_calendar_safe(now)
         
-        # Execute all tasks
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            result_index = 0
-            
-            # Weather is always first
-            briefing_data["weather"] = results[result_index]
-            result_index += 1
-            
-            if self.config.news_api_key:
-                briefing_data["news"] = results[result_index]
-                result_index += 1
-            
-            if self.config.stock_api_key:
-                briefing_data["stocks"] = results[result_index]
-                result_index += 1
-            
-            if self.config.calendar_enabled:
-                briefing_data["calendar"] = results[result_index]
+        # Execute all tasks; one failing section doesn't affect the others
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for section, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Unexpected {section} error: {result}")
+                result = {"error": str(result)}
+            briefing_data[section] = result
         
         return briefing_data
     
@@ -107,10 +114,10 @@ class BriefingService:
             logger.error(f"Stock service error: {e}")
             return {"error": str(e)}
     
-    async def _get_calendar_safe(self):
+    async def _get_calendar_safe(self, now: datetime):
         """Safely get calendar data"""
         try:
-            return await self.calendar_service.get_today_events()
+            return self.calendar_service.get_today_events(now)
         except Exception as e:
             logger.error(f"Calendar service error: {e}")
             return {"error": str(e)}
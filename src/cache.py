@@ -0,0 +1,93 @@
+"""
+Response Cache - Small on-disk TTL cache for parsed API responses
+"""
+
+import functools
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).parent.parent / "cache"
+
+
+class TTLCache:
+    """JSON file backed cache whose entries expire after a TTL"""
+
+    def __init__(self, name: str, cache_dir: Path = CACHE_DIR):
+        self.path = cache_dir / f"{name}.json"
+        self._entries: Optional[Dict[str, Tuple[float, Any]]] = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.time():
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Store value under key for ttl seconds"""
+        entries = self._load()
+        now = time.time()
+
+        # Drop expired entries so the file doesn't grow forever
+        for stale_key in [k for k, (expires_at, _) in entries.items() if expires_at <= now]:
+            del entries[stale_key]
+
+        entries[key] = (now + ttl, value)
+        self._save()
+
+    def _load(self) -> Dict[str, Tuple[float, Any]]:
+        """Load entries from disk on first access"""
+        if self._entries is None:
+            try:
+                data = orjson.loads(self.path.read_bytes())
+                self._entries = {k: tuple(v) for k, v in data.items()}
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cache file {self.path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        """Write entries to disk atomically"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_bytes(orjson.dumps(self._entries))
+            tmp_path.replace(self.path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to write cache file {self.path}: {e}")
+
+
+def ttl_cache(name: str, ttl: float, key: Callable[..., str]):
+    """Cache the result of an async function on disk for ttl seconds
+
+    `key` receives the same arguments as the decorated function and
+    returns the cache key for that call.
+    """
+    cache = TTLCache(name)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Cache hit for {cache_key}")
+                return cached
+
+            result = await func(*args, **kwargs)
+            cache.set(cache_key, result, ttl)
+            return result
+        return wrapper
+    return decorator
@@ -3,11 +3,36 @@ Calendar Service - Fetches calendar events (placeholder for Google Calendar inte
 """
 
 import logging
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from typing import Dict, Any
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Mock events for demonstration (never change, so built once at import)
+MOCK_EVENTS = (
+    {
+        "title": "Morning Standup",
+        "time": "09:00 AM",
+        "duration": "30 minutes",
+        "location": "Conference Room A",
+        "attendees": ["team@company.com"]
+    },
+    {
+        "title": "Project Review Meeting",
+        "time": "02:00 PM",
+        "duration": "1 hour",
+        "location": "Zoom",
+        "attendees": ["manager@company.com", "colleague@company.com"]
+    },
+    {
+        "title": "Doctor Appointment",
+        "time": "04:30 PM",
+        "duration": "45 minutes",
+        "location": "Medical Center",
+        "attendees": []
+    }
+)
+
 
 class CalendarService:
     """Service for fetching calendar events"""
@@ -15,55 +40,25 @@ class CalendarService:
     def __init__(self, config):
         self.config = config
     
-    async def get_today_events(self) -> Dict[str, Any]:
-        """Get today's calendar events"""
-        if not self.config.calendar_enabled:
-            return {
-                "enabled": False,
-                "message": "Calendar integration not enabled"
-            }
-        
+    def get_today_events(self, now: datetime) -> Dict[str, Any]:
+        """Get today's calendar events (no I/O yet, so this is synchronous)
+
+        Callers only ask for events when calendar_enabled is set.
+        """
         # For now, return a placeholder implementation
         # In a full implementation, you would integrate with Google Calendar API
         # or Microsoft Graph API for Outlook
         
-        return await self._get_mock_events()
+        return self._get_mock_events(now)
     
-    async def _get_mock_events(self) -> Dict[str, Any]:
+    def _get_mock_events(self, now: datetime) -> Dict[str, Any]:
         """Return mock calendar events for demonstration"""
-        today = datetime.now()
-        
-        # Mock events for demonstration
-        mock_events = [
-            {
-                "title": "Morning Standup",
-                "time": "09:00 AM",
-                "duration": "30 minutes",
-                "location": "Conference Room A",
-                "attendees": ["team@company.com"]
-            },
-            {
-                "title": "Project Review Meeting",
-                "time": "02:00 PM",
-                "duration": "1 hour",
-                "location": "Zoom",
-                "attendees": ["manager@company.com", "colleague@company.com"]
-            },
-            {
-                "title": "Doctor Appointment",
-                "time": "04:30 PM",
-                "duration": "45 minutes",
-                "location": "Medical Center",
-                "attendees": []
-            }
-        ]
-        
         return {
             "enabled": True,
-            "date": today.strftime("%Y-%m-%d"),
-            "day_name": today.strftime("%A"),
-            "events": mock_events,
-            "total_events": len(mock_events),
+            "date": now.date().isoformat(),
+            "day_name": now.strftime("%A"),
+            "events": MOCK_EVENTS,
+            "total_events": len(MOCK_EVENTS),
             "note": "This is a mock implementation. To enable real calendar integration, configure Google Calendar or Outlook API credentials."
         }
     
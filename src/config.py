@@ -3,7 +3,9 @@ Configuration management for the Daily Briefing Bot
 """
 
 import os
-from typing import Optional
+import functools
+from pathlib import Path
+from typing import Optional, Tuple
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
@@ -11,9 +13,15 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass
+DEFAULT_STOCK_SYMBOLS = ("AAPL", "GOOGL", "MSFT", "TSLA")
+
+
+@dataclass(frozen=True)
 class Config:
-    """Configuration class for API keys and settings"""
+    """Configuration class for API keys and settings
+
+    Use get_config() to build one from the environment.
+    """
     
     # Weather API (Open-Meteo - Free, no API key required)
     weather_city: str = "Surat"
@@ -26,7 +34,7 @@ class Config:
     
     # Stock API (Alpha Vantage)
     stock_api_key: Optional[str] = None
-    stock_symbols: list = None
+    stock_symbols: Tuple[str, ...] = DEFAULT_STOCK_SYMBOLS
     
     # Email notifications
     email_enabled: bool = False
@@ -46,33 +54,6 @@ class Config:
     calendar_enabled: bool = False
     calendar_type: str = "google"  # google, outlook
     
-    def __post_init__(self):
-        """Load configuration from environment variables"""
-        # Try to load .env file explicitly
-        from pathlib import Path
-        env_path = Path(__file__).parent.parent / '.env'
-        load_dotenv(env_path)
-        
-        self.weather_city = os.getenv("WEATHER_CITY", self.weather_city)
-        
-        self.news_api_key = os.getenv("NEWS_API_KEY", self.news_api_key)
-        self.news_country = os.getenv("NEWS_COUNTRY", self.news_country)
-        
-        self.stock_api_key = os.getenv("STOCK_API_KEY", self.stock_api_key)
-        stock_symbols_env = os.getenv("STOCK_SYMBOLS", "AAPL,GOOGL,MSFT,TSLA")
-        self.stock_symbols = stock_symbols_env.split(",") if stock_symbols_env else ["AAPL", "GOOGL", "MSFT", "TSLA"]
-        
-        self.email_from = os.getenv("EMAIL_FROM", self.email_from)
-        self.email_password = os.getenv("EMAIL_PASSWORD", self.email_password)
-        self.email_to = os.getenv("EMAIL_TO", self.email_to)
-        
-        self.discord_webhook_url = os.getenv("DISCORD_WEBHOOK_URL", self.discord_webhook_url)
-        self.slack_webhook_url = os.getenv("SLACK_WEBHOOK_URL", self.slack_webhook_url)
-        
-        # Enable email if credentials are provided
-        if self.email_from and self.email_password and self.email_to:
-            self.email_enabled = True
-    
     def validate(self) -> bool:
         """Validate that required API keys are present"""
         missing_keys = []
@@ -91,3 +72,37 @@ class Config:
             return False
         
         return True
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Load configuration from environment variables (once per process)"""
+    # Try to load .env file explicitly
+    env_path = Path(__file__).parent.parent / '.env'
+    load_dotenv(env_path)
+    
+    stock_symbols_env = os.getenv("STOCK_SYMBOLS", ",".join(DEFAULT_STOCK_SYMBOLS))
+    stock_symbols = tuple(stock_symbols_env.split(",")) if stock_symbols_env else DEFAULT_STOCK_SYMBOLS
+    
+    email_from = os.getenv("EMAIL_FROM", Config.email_from)
+    email_password = os.getenv("EMAIL_PASSWORD", Config.email_password)
+    email_to = os.getenv("EMAIL_TO", Config.email_to)
+    
+    return Config(
+        weather_city=os.getenv("WEATHER_CITY", Config.weather_city),
+        
+        news_api_key=os.getenv("NEWS_API_KEY", Config.news_api_key),
+        news_country=os.getenv("NEWS_COUNTRY", Config.news_country),
+        
+        stock_api_key=os.getenv("STOCK_API_KEY", Config.stock_api_key),
+        stock_symbols=stock_symbols,
+        
+        # Enable email if credentials are provided
+        email_enabled=bool(email_from and email_password and email_to),
+        email_from=email_from,
+        email_password=email_password,
+        email_to=email_to,
+        
+        discord_webhook_url=os.getenv("DISCORD_WEBHOOK_URL", Config.discord_webhook_url),
+        slack_webhook_url=os.getenv("SLACK_WEBHOOK_URL", Config.slack_webhook_url),
+    )
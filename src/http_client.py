@@ -0,0 +1,66 @@
+"""
+HTTP Client - Shared aiohttp session and retry policy used by all services
+"""
+
+import aiohttp
+import asyncio
+import logging
+import tenacity
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitError(Exception):
+    """Raised when an API reports that its rate limit was hit"""
+
+
+# Errors worth retrying: network failures, timeouts, 429/5xx and rate limits
+RETRYABLE_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, RateLimitError)
+
+
+def api_retry(attempts: int = 3, multiplier: float = 1, max_wait: float = 10):
+    """Retry a coroutine on transient errors with jittered exponential backoff"""
+    return tenacity.retry(
+        stop=tenacity.stop_after_attempt(attempts),
+        wait=tenacity.wait_exponential(multiplier=multiplier, max=max_wait) + tenacity.wait_random(0, 1),
+        retry=tenacity.retry_if_exception_type(RETRYABLE_ERRORS),
+        before_sleep=tenacity.before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+
+
+def raise_for_transient_status(response: aiohttp.ClientResponse):
+    """Raise a retryable ClientResponseError for 429 and 5xx responses"""
+    if response.status == 429 or response.status >= 500:
+        response.raise_for_status()
+
+
+class SharedSession:
+    """Lazily-created aiohttp session shared across services"""
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use"""
+        # aiohttp sessions must be created inside a running event loop
+        if self._session is None or self._session.closed:
+            # aiohttp speaks HTTP/1.1 only; keep-alive pooling is what lets
+            # repeated calls to the same API skip the TCP+TLS handshake
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    limit_per_host=5,  # Matches the Alpha Vantage per-minute budget
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
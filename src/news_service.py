@@ -2,20 +2,54 @@
 News Service - Fetches news headlines using News API
 """
 
-import aiohttp
 import logging
-from typing import Dict, Any, List
+import msgspec
+from typing import Dict, Any, List, Optional
+
+from .cache import ttl_cache
+from .http_client import api_retry, raise_for_transient_status
 
 logger = logging.getLogger(__name__)
 
 
+class NewsSource(msgspec.Struct, frozen=True):
+    """Source of a News API article"""
+    name: Optional[str] = "Unknown"
+
+
+class NewsArticle(msgspec.Struct, rename="camel"):
+    """News API article (fields we don't display are skipped while decoding)"""
+    title: Optional[str] = "No title"
+    description: Optional[str] = "No description"
+    source: NewsSource = NewsSource()
+    url: Optional[str] = ""
+    published_at: Optional[str] = ""
+    author: Optional[str] = "Unknown"
+
+
+class NewsResponse(msgspec.Struct, rename="camel"):
+    """News API top-headlines response"""
+    total_results: int = 0
+    articles: List[NewsArticle] = []
+
+
+_news_decoder = msgspec.json.Decoder(NewsResponse)
+
+
 class NewsService:
     """Service for fetching news headlines"""
     
-    def __init__(self, config):
+    def __init__(self, config, http_session):
         self.config = config
+        self.http_session = http_session
         self.base_url = "https://newsapi.org/v2"
     
+    @ttl_cache(
+        "news",
+        ttl=1800,  # Headlines change slowly
+        key=lambda self: f"news:{self.config.news_country}:{self.config.news_category}"
+    )
+    @api_retry()
     async def get_top_headlines(self) -> Dict[str, Any]:
         """Get top news headlines"""
         if not self.config.news_api_key:
@@ -28,35 +62,34 @@ class NewsService:
         params = {
             "country": self.config.news_country,
             "category": self.config.news_category,
-            "pageSize": 10  # Get top 10 headlines
+            "pageSize": 5  # Only the top 5 headlines are shown
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_news_data(data)
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"News API error: {response.status} - {error_text}")
+        session = await self.http_session.get()
+        async with session.get(url, headers=headers, params=params) as response:
+            raise_for_transient_status(response)
+            if response.status == 200:
+                data = _news_decoder.decode(await response.read())
+                return self._parse_news_data(data)
+            else:
+                error_text = await response.text()
+                raise Exception(f"News API error: {response.status} - {error_text}")
     
-    def _parse_news_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_news_data(self, data: NewsResponse) -> Dict[str, Any]:
         """Parse news API response"""
-        articles = data.get("articles", [])
-        
         parsed_articles = []
-        for article in articles[:5]:  # Top 5 headlines
+        for article in data.articles:
             parsed_articles.append({
-                "title": article.get("title", "No title"),
-                "description": article.get("description", "No description"),
-                "source": article.get("source", {}).get("name", "Unknown"),
-                "url": article.get("url", ""),
-                "published_at": article.get("publishedAt", ""),
-                "author": article.get("author", "Unknown")
+                "title": article.title,
+                "description": article.description,
+                "source": article.source.name,
+                "url": article.url,
+                "published_at": article.published_at,
+                "author": article.author
             })
         
         return {
-            "total_results": data.get("totalResults", 0),
+            "total_results": data.total_results,
             "articles": parsed_articles,
             "category": self.config.news_category.title(),
             "country": self.config.news_country.upper()
@@ -2,49 +2,102 @@
 Notification Service - Handles sending briefings via various channels
 """
 
+import asyncio
 import logging
 import smtplib
-import aiohttp
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 
 logger = logging.getLogger(__name__)
 
+# Message layout, built once at import and filled in with str.format
+SECTION_RULE = "-" * 20
+
+HEADER_TEMPLATE = "📋 Daily Briefing for {date}\n"
+
+WEATHER_TEMPLATE = "\n".join([
+    "🌤️ WEATHER",
+    SECTION_RULE,
+    "📍 {city} ({coordinates})",
+    "🌡️ {temperature} (feels like {feels_like})",
+    "📊 High: {today_high} | Low: {today_low}",
+    "{icon} {description}",
+    "💨 Wind: {wind_speed}",
+    "💧 Humidity: {humidity}",
+])
+WEATHER_RAIN_TEMPLATE = "🌧️ Rain: {rain}"
+FORECAST_TEMPLATE = "  {time}: {temperature} - {description}{rain_info}"
+
+NEWS_HEADER = f"📰 NEWS HIGHLIGHTS\n{SECTION_RULE}"
+ARTICLE_TEMPLATE = "{index}. {title}\n   Source: {source}"
+
+STOCKS_HEADER = f"📈 STOCK PRICES\n{SECTION_RULE}"
+STOCK_TEMPLATE = "{emoji} {symbol}: {price} ({change}, {change_percent})"
+
+CALENDAR_HEADER = f"📅 TODAY'S SCHEDULE\n{SECTION_RULE}"
+EVENT_TEMPLATE = "🕐 {time}: {title}{location_text}"
+
+NOTES_HEADER = f"⚠️ NOTES\n{SECTION_RULE}"
+
+# Fallbacks for missing fields, merged in once so the templates see plain values
+WEATHER_DEFAULTS = {
+    "city": "N/A",
+    "coordinates": "N/A",
+    "today_high": "N/A",
+    "today_low": "N/A",
+}
+CURRENT_WEATHER_DEFAULTS = {
+    "temperature": "N/A",
+    "feels_like": "N/A",
+    "icon": "",
+    "description": "N/A",
+    "wind_speed": "N/A",
+    "humidity": "N/A",
+    "rain": "N/A",
+}
+FORECAST_DEFAULTS = {"time": "", "temperature": "N/A", "description": "N/A", "rain": ""}
+STOCK_DEFAULTS = {
+    "symbol": "N/A",
+    "price": "N/A",
+    "change": "N/A",
+    "change_percent": "N/A",
+    "is_positive": False,
+}
+EVENT_DEFAULTS = {"title": "No title", "time": "", "location": ""}
+
+
+def _truncate(text: str, width: int = 100) -> str:
+    """Shorten text to width characters, marking the cut with an ellipsis"""
+    return text if len(text) <= width else text[:width] + "..."
+
 
 class Notifier:
     """Service for sending notifications"""
     
-    def __init__(self, config):
+    def __init__(self, config, http_session):
         self.config = config
+        self.http_session = http_session
     
     async def send_briefing(self, briefing_data: Dict[str, Any]):
         """Send briefing through all configured channels"""
         message = self._format_briefing_message(briefing_data)
         
-        # Send via email if configured
+        # Send through every configured channel concurrently
+        channels = {}
         if self.config.email_enabled:
-            try:
-                await self._send_email(message, briefing_data)
-                logger.info("Briefing sent via email")
-            except Exception as e:
-                logger.error(f"Failed to send email: {e}")
-        
-        # Send via Discord if configured
+            channels["email"] = self._send_email(message, briefing_data)
         if self.config.discord_webhook_url:
-            try:
-                await self._send_discord_message(message)
-                logger.info("Briefing sent via Discord")
-            except Exception as e:
-                logger.error(f"Failed to send Discord message: {e}")
-        
-        # Send via Slack if configured
+            channels["Discord"] = self._send_discord_message(message)
         if self.config.slack_webhook_url:
-            try:
-                await self._send_slack_message(message)
-                logger.info("Briefing sent via Slack")
-            except Exception as e:
-                logger.error(f"Failed to send Slack message: {e}")
+            channels["Slack"] = self._send_slack_message(message)
+        
+        results = await asyncio.gather(*channels.values(), return_exceptions=True)
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send briefing via {channel}: {result}")
+            else:
+                logger.info(f"Briefing sent via {channel}")
         
         # Always log to console
         print("=" * 60)
@@ -55,98 +108,86 @@ class Notifier:
     
     def _format_briefing_message(self, briefing_data: Dict[str, Any]) -> str:
         """Format briefing data into a readable message"""
-        message_parts = []
-        
-        # Header
-        message_parts.append(f"📋 Daily Briefing for {briefing_data.get('date', 'Today')}")
-        message_parts.append("")
+        return "\n".join(self._iter_message_lines(briefing_data))
+    
+    def _iter_message_lines(self, briefing_data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the lines of the briefing message"""
+        yield HEADER_TEMPLATE.format(date=briefing_data.get('date', 'Today'))
         
         # Weather section
         weather = briefing_data.get("weather")
         if weather and "error" not in weather:
-            message_parts.append("🌤️ WEATHER")
-            message_parts.append("-" * 20)
-            current = weather.get("current", {})
-            message_parts.append(f"📍 {weather.get('city', 'N/A')} ({weather.get('coordinates', 'N/A')})")
-            message_parts.append(f"🌡️ {current.get('temperature', 'N/A')} (feels like {current.get('feels_like', 'N/A')})")
-            message_parts.append(f"📊 High: {weather.get('today_high', 'N/A')} | Low: {weather.get('today_low', 'N/A')}")
-            message_parts.append(f"{current.get('icon', '')} {current.get('description', 'N/A')}")
-            message_parts.append(f"💨 Wind: {current.get('wind_speed', 'N/A')}")
-            message_parts.append(f"💧 Humidity: {current.get('humidity', 'N/A')}")
-            if current.get('rain') != "No rain":
-                message_parts.append(f"🌧️ Rain: {current.get('rain', 'N/A')}")
-            message_parts.append("")
+            current = {**CURRENT_WEATHER_DEFAULTS, **weather.get("current", {})}
+            yield WEATHER_TEMPLATE.format_map({**WEATHER_DEFAULTS, **weather, **current})
+            if current["rain"] != "No rain":
+                yield WEATHER_RAIN_TEMPLATE.format(rain=current["rain"])
+            yield ""
             
             # Forecast
             forecast = weather.get("forecast", [])
             if forecast:
-                message_parts.append("📈 Next 12 Hours:")
+                yield "📈 Next 12 Hours:"
                 for item in forecast:
-                    time_str = item.get("time", "")
-                    rain_info = f" | {item.get('rain', '')}" if item.get('rain') != "No rain" else ""
-                    message_parts.append(f"  {time_str}: {item.get('temperature', 'N/A')} - {item.get('description', 'N/A')}{rain_info}")
-            message_parts.append("")
+                    item = {**FORECAST_DEFAULTS, **item}
+                    rain_info = f" | {item['rain']}" if item['rain'] != "No rain" else ""
+                    yield FORECAST_TEMPLATE.format_map({**item, "rain_info": rain_info})
+            yield ""
         
         # News section
         news = briefing_data.get("news")
         if news and "error" not in news:
-            message_parts.append("📰 NEWS HIGHLIGHTS")
-            message_parts.append("-" * 20)
-            articles = news.get("articles", [])
-            for i, article in enumerate(articles, 1):
-                message_parts.append(f"{i}. {article.get('title', 'No title')}")
-                message_parts.append(f"   Source: {article.get('source', 'Unknown')}")
-                if article.get('description'):
-                    desc = article['description'][:100] + "..." if len(article['description']) > 100 else article['description']
-                    message_parts.append(f"   {desc}")
-                message_parts.append("")
+            yield NEWS_HEADER
+            for i, article in enumerate(news.get("articles", []), 1):
+                yield ARTICLE_TEMPLATE.format(
+                    index=i,
+                    title=article.get('title', 'No title'),
+                    source=article.get('source', 'Unknown')
+                )
+                description = article.get('description')
+                if description:
+                    yield f"   {_truncate(description)}"
+                yield ""
         
         # Stocks section
         stocks = briefing_data.get("stocks")
         if stocks and "error" not in stocks:
-            message_parts.append("📈 STOCK PRICES")
-            message_parts.append("-" * 20)
-            stock_list = stocks.get("stocks", [])
-            for stock in stock_list:
+            yield STOCKS_HEADER
+            for stock in stocks.get("stocks", []):
                 if "error" not in stock:
-                    symbol = stock.get("symbol", "N/A")
-                    price = stock.get("price", "N/A")
-                    change = stock.get("change", "N/A")
-                    change_percent = stock.get("change_percent", "N/A")
-                    emoji = "📈" if stock.get("is_positive", False) else "📉"
-                    message_parts.append(f"{emoji} {symbol}: {price} ({change}, {change_percent})")
-            message_parts.append("")
+                    stock = {**STOCK_DEFAULTS, **stock}
+                    emoji = "📈" if stock["is_positive"] else "📉"
+                    yield STOCK_TEMPLATE.format_map({**stock, "emoji": emoji})
+            yield ""
         
         # Calendar section
         calendar_data = briefing_data.get("calendar")
         if calendar_data and calendar_data.get("enabled") and "error" not in calendar_data:
-            message_parts.append("📅 TODAY'S SCHEDULE")
-            message_parts.append("-" * 20)
+            yield CALENDAR_HEADER
             events = calendar_data.get("events", [])
             if events:
                 for event in events:
-                    title = event.get("title", "No title")
-                    time_str = event.get("time", "")
-                    location = event.get("location", "")
-                    location_text = f" @ {location}" if location else ""
-                    message_parts.append(f"🕐 {time_str}: {title}{location_text}")
+                    event = {**EVENT_DEFAULTS, **event}
+                    location_text = f" @ {event['location']}" if event['location'] else ""
+                    yield EVENT_TEMPLATE.format_map({**event, "location_text": location_text})
             else:
-                message_parts.append("No events scheduled for today")
-            message_parts.append("")
+                yield "No events scheduled for today"
+            yield ""
         
         # Errors section
         errors = briefing_data.get("errors", [])
         if errors:
-            message_parts.append("⚠️ NOTES")
-            message_parts.append("-" * 20)
+            yield NOTES_HEADER
             for error in errors:
-                message_parts.append(f"• {error}")
-            message_parts.append("")
-        
-        return "\n".join(message_parts)
+                yield f"• {error}"
+            yield ""
     
     async def _send_email(self, message: str, briefing_data: Dict[str, Any]):
         """Send briefing via email"""
+        # smtplib blocks, so run it on the default executor to keep the event loop free
+        await asyncio.to_thread(self._send_email_blocking, message, briefing_data)
+    
+    def _send_email_blocking(self, message: str, briefing_data: Dict[str, Any]):
+        """Build and send the briefing email (synchronous)"""
         msg = MIMEMultipart()
         msg['From'] = self.config.email_from
         msg['To'] = self.config.email_to
@@ -165,11 +206,11 @@ class Notifier:
             "content": f"```\n{message}\n```"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.config.discord_webhook_url, json=payload) as response:
-                if response.status not in [200, 204]:
-                    error_text = await response.text()
-                    raise Exception(f"Discord webhook error: {response.status} - {error_text}")
+        session = await self.http_session.get()
+        async with session.post(self.config.discord_webhook_url, json=payload) as response:
+            if response.status not in [200, 204]:
+                error_text = await response.text()
+                raise Exception(f"Discord webhook error: {response.status} - {error_text}")
     
     async def _send_slack_message(self, message: str):
         """Send briefing via Slack webhook"""
@@ -177,8 +218,8 @@ class Notifier:
             "text": f"```{message}```"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.config.slack_webhook_url, json=payload) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Slack webhook error: {response.status} - {error_text}")
+        session = await self.http_session.get()
+        async with session.post(self.config.slack_webhook_url, json=payload) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Slack webhook error: {response.status} - {error_text}")
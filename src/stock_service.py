@@ -2,44 +2,86 @@
 Stock Service - Fetches stock prices using Alpha Vantage API
 """
 
-import aiohttp
+import asyncio
 import logging
-from typing import Dict, Any, List
+import msgspec
+from aiolimiter import AsyncLimiter
+from typing import Dict, Any, Optional
+
+from .cache import ttl_cache
+from .http_client import RateLimitError, api_retry, raise_for_transient_status
 
 logger = logging.getLogger(__name__)
 
+# Alpha Vantage free tier allows 5 requests per minute
+REQUESTS_PER_MINUTE = 5
+
+
+class GlobalQuote(msgspec.Struct):
+    """Alpha Vantage GLOBAL_QUOTE payload (all values are strings)"""
+    symbol: Optional[str] = msgspec.field(default=None, name="01. symbol")
+    open: str = msgspec.field(default="0", name="02. open")
+    high: str = msgspec.field(default="0", name="03. high")
+    low: str = msgspec.field(default="0", name="04. low")
+    price: str = msgspec.field(default="0", name="05. price")
+    volume: str = msgspec.field(default="0", name="06. volume")
+    latest_trading_day: str = msgspec.field(default="", name="07. latest trading day")
+    previous_close: str = msgspec.field(default="0", name="08. previous close")
+    change: str = msgspec.field(default="0", name="09. change")
+    change_percent: str = msgspec.field(default="0%", name="10. change percent")
+
+
+class AlphaVantageResponse(msgspec.Struct):
+    """Alpha Vantage quote response, including its error/limit messages"""
+    global_quote: Optional[GlobalQuote] = msgspec.field(default=None, name="Global Quote")
+    error_message: Optional[str] = msgspec.field(default=None, name="Error Message")
+    note: Optional[str] = msgspec.field(default=None, name="Note")
+
+
+_quote_decoder = msgspec.json.Decoder(AlphaVantageResponse)
+
 
 class StockService:
     """Service for fetching stock market data"""
     
-    def __init__(self, config):
+    def __init__(self, config, http_session):
         self.config = config
+        self.http_session = http_session
         self.base_url = "https://www.alphavantage.co/query"
+        # Pace quote requests so extra symbols wait instead of hitting the limit
+        self._limiter = AsyncLimiter(REQUESTS_PER_MINUTE, 60)
     
     async def get_stock_prices(self) -> Dict[str, Any]:
         """Get current stock prices for configured symbols"""
         if not self.config.stock_api_key:
             raise ValueError("Stock API key not configured")
         
-        stock_data = []
+        symbols = self.config.stock_symbols
         
-        # Get data for each stock symbol
-        for symbol in self.config.stock_symbols:
-            try:
-                data = await self._get_stock_quote(symbol)
-                stock_data.append(data)
-            except Exception as e:
-                logger.error(f"Error fetching data for {symbol}: {e}")
+        # Fetch all quotes concurrently
+        results = await asyncio.gather(
+            *(self._get_stock_quote(symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        
+        stock_data = []
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching data for {symbol}: {result}")
                 stock_data.append({
                     "symbol": symbol,
-                    "error": str(e)
+                    "error": str(result)
                 })
+            else:
+                stock_data.append(result)
         
         return {
             "stocks": stock_data,
             "symbols": self.config.stock_symbols
         }
     
+    @ttl_cache("stocks", ttl=300, key=lambda self, symbol: f"stock:{symbol}")  # Saves Alpha Vantage quota
+    @api_retry()
     async def _get_stock_quote(self, symbol: str) -> Dict[str, Any]:
         """Get quote for a single stock symbol"""
         params = {
@@ -48,48 +90,49 @@ class StockService:
             "apikey": self.config.stock_api_key
         }
         
-        async with aiohttp.ClientSession() as session:
+        session = await self.http_session.get()
+        async with self._limiter:
             async with session.get(self.base_url, params=params) as response:
+                raise_for_transient_status(response)
                 if response.status == 200:
-                    data = await response.json()
+                    data = _quote_decoder.decode(await response.read())
                     return self._parse_stock_data(symbol, data)
                 else:
                     error_text = await response.text()
                     raise Exception(f"Stock API error for {symbol}: {response.status} - {error_text}")
     
-    def _parse_stock_data(self, symbol: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_stock_data(self, symbol: str, data: AlphaVantageResponse) -> Dict[str, Any]:
         """Parse stock API response"""
         # Check if we have an error response
-        if "Error Message" in data:
-            raise Exception(f"API Error: {data['Error Message']}")
+        if data.error_message is not None:
+            raise Exception(f"API Error: {data.error_message}")
         
-        if "Note" in data:
-            raise Exception(f"API Limit: {data['Note']}")
+        if data.note is not None:
+            raise RateLimitError(f"API Limit: {data.note}")
         
-        quote_data = data.get("Global Quote", {})
+        quote = data.global_quote
         
-        if not quote_data:
+        if quote is None or quote.symbol is None:
             raise Exception("No quote data returned")
         
         # Parse the quote data
         try:
-            price = float(quote_data.get("05. price", 0))
-            change = float(quote_data.get("09. change", 0))
-            change_percent = quote_data.get("10. change percent", "0%").replace("%", "")
-            change_percent = float(change_percent)
+            price = float(quote.price)
+            change = float(quote.change)
+            change_percent = float(quote.change_percent.replace("%", ""))
             
             return {
                 "symbol": symbol,
                 "price": f"${price:.2f}",
                 "change": f"${change:+.2f}",
                 "change_percent": f"{change_percent:+.2f}%",
-                "previous_close": f"${float(quote_data.get('08. previous close', 0)):.2f}",
-                "open": f"${float(quote_data.get('02. open', 0)):.2f}",
-                "high": f"${float(quote_data.get('03. high', 0)):.2f}",
-                "low": f"${float(quote_data.get('04. low', 0)):.2f}",
-                "volume": quote_data.get("06. volume", "0"),
-                "latest_trading_day": quote_data.get("07. latest trading day", ""),
+                "previous_close": f"${float(quote.previous_close):.2f}",
+                "open": f"${float(quote.open):.2f}",
+                "high": f"${float(quote.high):.2f}",
+                "low": f"${float(quote.low):.2f}",
+                "volume": quote.volume,
+                "latest_trading_day": quote.latest_trading_day,
                 "is_positive": change >= 0
             }
-        except (ValueError, KeyError) as e:
+        except ValueError as e:
             raise Exception(f"Error parsing stock data for {symbol}: {e}")
@@ -9,7 +9,7 @@ import logging
 import os
 from dotenv import load_dotenv
 from src.briefing_service import BriefingService
-from src.config import Config
+from src.config import get_config
 from src.notifier import Notifier
 
 # Load environment variables from .env file
@@ -24,7 +24,7 @@ async def test_briefing():
     print("=" * 50)
     
     # Initialize services
-    config = Config()
+    config = get_config()
     
     # Validate configuration
     if not config.validate():
@@ -40,21 +40,21 @@ async def test_briefing():
     print("=" * 50)
     
     # Generate briefing
-    briefing_service = BriefingService(config)
-    notifier = Notifier(config)
-    
-    try:
-        print("\nGenerating briefing...")
-        briefing_data = await briefing_service.get_full_briefing()
-        
-        print("Sending briefing...")
-        await notifier.send_briefing(briefing_data)
-        
-        print("\n✅ Test completed successfully!")
+    async with BriefingService(config) as briefing_service:
+        notifier = Notifier(config, briefing_service.http_session)
         
-    except Exception as e:
-        print(f"\n❌ Test failed with error: {e}")
-        logging.error(f"Test failed: {e}")
+        try:
+            print("\nGenerating briefing...")
+            briefing_data = await briefing_service.get_full_briefing()
+            
+            print("Sending briefing...")
+            await notifier.send_briefing(briefing_data)
+            
+            print("\n✅ Test completed successfully!")
+            
+        except Exception as e:
+            print(f"\n❌ Test failed with error: {e}")
+            logging.error(f"Test failed: {e}")
 
 if __name__ == "__main__":
     asyncio.run(test_briefing())